@@ -1,230 +1,398 @@
 from datetime import datetime, timedelta
+import bisect
+import functools
+import importlib.util
 import math
-import time
 import sys
+import threading
 
-# Global flag for Skyfield availability
-try:
-    from skyfield.api import load, Topos
-    from skyfield import almanac
-    HAS_SKYFIELD = True
-except ImportError:
-    HAS_SKYFIELD = False
+# Global flag for Skyfield availability (imported on first use)
+HAS_SKYFIELD = importlib.util.find_spec('skyfield') is not None
+
+# Fixed UTC offsets used for display
+_TEHRAN_OFFSET = timedelta(hours=3, minutes=30)
+_EST_OFFSET = timedelta(hours=-4)
+_BST_OFFSET = timedelta(hours=1)
+_JST_OFFSET = timedelta(hours=9)
+
+# Distance from Tehran noon (seconds) within which Skyfield refines the estimate
+_SKYFIELD_BAND_SECONDS = 3600
+
+# Shared Skyfield timescale and ephemeris (loaded once per process)
+@functools.lru_cache(maxsize=1)
+def _get_skyfield():
+    """Load the Skyfield timescale and ephemeris once and reuse them"""
+    from skyfield.api import load
+    
+    return load.timescale(), load('de421.bsp')
+
+# Prebuilt bar strings for the default progress bar width
+_FULL = '█' * 50
+_EMPTY = '░' * 50
+
+def _hms(dt):
+    """Format the time of day as HH:MM:SS"""
+    return f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
+def _ymd(dt):
+    """Format the date as YYYY-MM-DD"""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
 
 def progress_bar(iteration, total, prefix='', suffix='', length=50, fill='█'):
     """
     Create a progress bar in the terminal
     """
-    percent = ("{0:.1f}").format(100 * (iteration / float(total)))
     filled_length = int(length * iteration // total)
-    bar = fill * filled_length + '░' * (length - filled_length)
+    if length == 50 and fill == '█':
+        bar = _FULL[:filled_length] + _EMPTY[filled_length:]
+    else:
+        bar = fill * filled_length + '░' * (length - filled_length)
     
-    sys.stdout.write(f'\r{prefix} |{bar}| {percent}% {suffix}')
+    sys.stdout.write(f'\r{prefix} |{bar}| {100 * iteration / total:.1f}% {suffix}')
     sys.stdout.flush()
     
     if iteration == total:
         print()
 
+def _vernal_equinox_newton(ts, eph, approx_t):
+    """Refine the March equinox with Newton steps on the Sun's ecliptic longitude"""
+    from skyfield.framelib import ecliptic_frame
+    
+    earth, sun = eph['earth'], eph['sun']
+    t = approx_t
+    
+    for _ in range(8):
+        lon = earth.at(t).observe(sun).apparent().frame_latlon(ecliptic_frame)[1].degrees
+        
+        # Longitude just below 360 means the equinox is still ahead
+        lon = (lon + 180.0) % 360.0 - 180.0
+        
+        # The Sun advances about 360 degrees per tropical year
+        step_days = lon / 360.0 * 365.2422
+        t = ts.tt_jd(t.tt - step_days)
+        
+        if abs(step_days) < 1e-6:
+            break
+    
+    return t
+
+def _memoize_year(func):
+    """Cache a per-year calculation; the dict is exposed as func.cache"""
+    cache = {}
+    
+    @functools.wraps(func)
+    def wrapper(gregorian_year):
+        if gregorian_year not in cache:
+            cache[gregorian_year] = func(gregorian_year)
+        return cache[gregorian_year]
+    
+    wrapper.cache = cache
+    return wrapper
+
+@_memoize_year
+def _equinox_with_skyfield(gregorian_year):
+    """Calculate exact equinox using Skyfield (errors propagate, so they are never cached)"""
+    ts, eph = _get_skyfield()
+    
+    # Start from the Meeus approximation (already a TDB Julian Day)
+    approx_t = ts.tdb_jd(_meeus_jde(gregorian_year))
+    return _vernal_equinox_newton(ts, eph, approx_t).utc_datetime()
+
+# Periodic terms (A, B, C) for the equinox, Meeus Table 27.C
+_EQUINOX_TERMS = (
+    (485, 324.96, 1934.136), (203, 337.23, 32964.467),
+    (199, 342.08, 20.186), (182, 27.85, 445267.112),
+    (156, 73.14, 45036.886), (136, 171.52, 22518.443),
+    (77, 222.54, 65928.934), (74, 296.72, 3034.906),
+    (70, 243.58, 9037.513), (58, 119.81, 33718.147),
+    (52, 297.17, 150.678), (50, 21.02, 2281.226),
+    (45, 247.54, 29929.562), (44, 325.15, 31555.956),
+    (29, 60.93, 4443.417), (18, 155.12, 67555.328),
+    (17, 288.79, 4562.452), (16, 198.04, 62894.029),
+    (14, 199.76, 31436.921), (12, 95.39, 14577.848),
+    (12, 287.11, 31931.756), (12, 320.81, 34777.259),
+    (9, 227.73, 1222.114), (8, 15.45, 16859.074),
+)
+
+_DEG = math.pi / 180.0
+
+def _meeus_jde(gregorian_year, cos=math.cos):
+    """Julian Ephemeris Day (TT) of the March equinox, Meeus chapter 27
+
+    Pass cos=np.cos to evaluate an array of years at once.
+    """
+    # Mean equinox (Table 27.B), in Horner form
+    t = (gregorian_year - 2000) / 1000.0
+    jde0 = ((((-0.00057 * t - 0.00411) * t + 0.05169) * t + 365242.37404) * t) + 2451623.80984
+    
+    # Periodic corrections bring the error down to about a minute
+    T = (jde0 - 2451545.0) / 36525
+    w = (35999.373 * T - 2.47) * _DEG
+    delta_lambda = 1 + 0.0334 * cos(w) + 0.0007 * cos(2 * w)
+    s = sum(a * cos((b + c * T) * _DEG) for a, b, c in _EQUINOX_TERMS)
+    
+    return jde0 + 0.00001 * s / delta_lambda
+
+def _delta_t(decimal_year):
+    """Approximate TT - UT in seconds (Espenak & Meeus polynomials)"""
+    y = decimal_year
+    if y < 1941:
+        t = y - 1920
+        return 21.20 + 0.84493 * t - 0.076100 * t ** 2 + 0.0020936 * t ** 3
+    if y < 1961:
+        t = y - 1950
+        return 29.07 + 0.407 * t - t ** 2 / 233 + t ** 3 / 2547
+    if y < 1986:
+        t = y - 1975
+        return 45.45 + 1.067 * t - t ** 2 / 260 - t ** 3 / 718
+    if y < 2005:
+        t = y - 2000
+        return (63.86 + 0.3345 * t - 0.060374 * t ** 2 + 0.0017275 * t ** 3
+                + 0.000651814 * t ** 4 + 0.00002373599 * t ** 5)
+    if y < 2050:
+        t = y - 2000
+        return 62.92 + 0.32217 * t + 0.005589 * t ** 2
+    return -20 + 32 * ((y - 1820) / 100) ** 2 - 0.5628 * (2150 - y)
+
+def _jd_to_ymd(jd):
+    """Convert a Julian Day (UT) to (year, month, day, hour, minute, second)"""
+    # Julian Days start at noon, so shift by half a day to start at midnight
+    jd_midnight = jd + 0.5
+    z = int(jd_midnight)
+    f = jd_midnight - z
+
+    if z < 2299161:
+        a = z
+    else:
+        alpha = int((z - 1867216.25) / 36524.25)
+        a = z + 1 + alpha - int(alpha / 4)
+
+    b = a + 1524
+    c = int((b - 122.1) / 365.25)
+    d = int(365.25 * c)
+    e = int((b - d) / 30.6001)
+
+    day = b - d - int(30.6001 * e) + f
+    day_int = int(day)
+    month = e - 1 if e < 14 else e - 13
+    year_calc = c - 4716 if month > 2 else c - 4715
+
+    # Convert fractional day to time
+    fractional_day = day - day_int
+    total_seconds = int(fractional_day * 86400)
+    hours = total_seconds // 3600
+    minutes = (total_seconds % 3600) // 60
+    seconds = total_seconds % 60
+
+    return year_calc, month, day_int, hours, minutes, seconds
+
+@_memoize_year
+def _equinox_with_fallback(gregorian_year):
+    """Calculate using astronomical formulas"""
+    # The equinox falls about a fifth of the way through the year
+    jd = _meeus_jde(gregorian_year) - _delta_t(gregorian_year + 0.2) / 86400
+
+    year, month, day, hours, minutes, seconds = _jd_to_ymd(jd)
+    return datetime(year, month, day, hours, minutes, seconds)
+
+# Persian leap years precomputed for every year the tool can encounter
+_PERSIAN_LEAP = frozenset(y for y in range(1200, 1600) if ((y + 38) % 2820) < 682)
+
+# Persian month names, Farvardin first
+_PERSIAN_MONTHS = (
+    "فروردین", "اردیبهشت", "خرداد",
+    "تیر", "مرداد", "شهریور",
+    "مهر", "آبان", "آذر",
+    "دی", "بهمن", "اسفند"
+)
+
 class PersianCalendar:
     """Convert Gregorian dates to Persian calendar dates"""
     
+    # Days elapsed at the end of each Persian month
+    _CUM_COMMON = (31, 62, 93, 124, 155, 186, 216, 246, 276, 306, 336, 365)
+    _CUM_LEAP = (31, 62, 93, 124, 155, 186, 216, 246, 276, 306, 336, 366)
+    
     @staticmethod
     def gregorian_to_persian(gregorian_date):
         """Convert Gregorian date to Persian date"""
         g_year = gregorian_date.year
-        g_month = gregorian_date.month
-        g_day = gregorian_date.day
+        doy = gregorian_date.timetuple().tm_yday
         
         # Persian year starts at Nowruz (around March 20-21)
         # If date is on or after Nowruz of current Gregorian year, Persian year = Gregorian year - 621
         # If date is before Nowruz of current Gregorian year, Persian year = Gregorian year - 622
         
-        # Approximate Nowruz date (March 20-21)
-        nowruz_date = PersianCalendar._approximate_nowruz(g_year)
-        current_date = gregorian_date.date()
+        # Approximate Nowruz day of year (March 20-21)
+        nowruz_doy = PersianCalendar._approximate_nowruz(g_year)
         
-        if current_date >= nowruz_date:
+        # Calculate days since Nowruz
+        if doy >= nowruz_doy:
             persian_year = g_year - 621
-            start_date = nowruz_date
+            day_diff = doy - nowruz_doy
         else:
             persian_year = g_year - 622
-            start_date = PersianCalendar._approximate_nowruz(g_year - 1)
-        
-        # Calculate days since Nowruz
-        day_diff = (current_date - start_date).days
+            prev_year_days = 366 if PersianCalendar._is_gregorian_leap_year(g_year - 1) else 365
+            day_diff = doy + prev_year_days - PersianCalendar._approximate_nowruz(g_year - 1)
         
-        # Persian month lengths
-        month_lengths = [31, 31, 31, 31, 31, 31, 30, 30, 30, 30, 30, 29]
-        
-        # Handle leap year (Esfand has 30 days in leap years)
+        # Cumulative month lengths (Esfand has 30 days in leap years)
         if PersianCalendar._is_persian_leap_year(persian_year):
-            month_lengths[11] = 30
+            cum_days = PersianCalendar._CUM_LEAP
+        else:
+            cum_days = PersianCalendar._CUM_COMMON
         
         # Find correct month and day
-        day_counter = day_diff
-        persian_month = 1
-        persian_day = 1
-        
-        for month_idx, days_in_month in enumerate(month_lengths, 1):
-            if day_counter < days_in_month:
-                persian_month = month_idx
-                persian_day = day_counter + 1
-                break
-            day_counter -= days_in_month
+        month_idx = bisect.bisect_right(cum_days, day_diff)
+        if month_idx < 12:
+            persian_month = month_idx + 1
+            persian_day = day_diff - (cum_days[month_idx - 1] if month_idx else 0) + 1
+        else:
+            persian_month = 1
+            persian_day = 1
         
         return persian_year, persian_month, persian_day
     
     @staticmethod
     def _approximate_nowruz(gregorian_year):
-        """Approximate Nowruz date for conversion purposes"""
+        """Approximate Nowruz day of year for conversion purposes"""
         # Most Nowruz dates are March 20 or 21
-        day = 20 if (gregorian_year % 4) == 0 else 21
-        return datetime(gregorian_year, 3, day).date()
+        leap = PersianCalendar._is_gregorian_leap_year(gregorian_year)
+        day = 20 if leap else 21
+        # January and February span 59 days, plus one in leap years
+        return 59 + leap + day
+    
+    @staticmethod
+    def _is_gregorian_leap_year(gregorian_year):
+        """Check if a Gregorian year is a leap year"""
+        # Gregorian leap test (century rule included) without branching
+        return ((gregorian_year * 1073750999) & 3221352463) <= 126976
     
     @staticmethod
     def _is_persian_leap_year(persian_year):
         """Check if a Persian year is a leap year"""
         # Persian leap year: (year + 38) mod 2820 < 682
-        return ((persian_year + 38) % 2820) < 682
+        return persian_year in _PERSIAN_LEAP
     
     @staticmethod
     def get_persian_month_name(month):
         """Get Persian month names"""
-        months = {
-            1: "فروردین", 2: "اردیبهشت", 3: "خرداد", 
-            4: "تیر", 5: "مرداد", 6: "شهریور",
-            7: "مهر", 8: "آبان", 9: "آذر",
-            10: "دی", 11: "بهمن", 12: "اسفند"
-        }
-        return months.get(month, "")
+        return _PERSIAN_MONTHS[month - 1] if 1 <= month <= 12 else ""
+    
+    @staticmethod
+    def format_persian_date(year, month, day):
+        """Format a Persian date tuple in Persian style"""
+        month_name = PersianCalendar.get_persian_month_name(month)
+        
+        return f"{day} {month_name} {year}"
     
     @staticmethod
     def format_persian_datetime(gregorian_datetime):
         """Format datetime in Persian style"""
-        year, month, day = PersianCalendar.gregorian_to_persian(gregorian_datetime)
-        month_name = PersianCalendar.get_persian_month_name(month)
+        persian_date = PersianCalendar.gregorian_to_persian(gregorian_datetime)
         
-        time_str = gregorian_datetime.strftime("%H:%M:%S")
+        time_str = _hms(gregorian_datetime)
         
-        return f"{day} {month_name} {year} - {time_str}"
+        return f"{PersianCalendar.format_persian_date(*persian_date)} - {time_str}"
 
 class NowruzPredictor:
     def __init__(self):
-        # Use Tehran coordinates for accurate calculation
-        self.lat = 35.6892  # Tehran latitude
-        self.lon = 51.3890  # Tehran longitude
-        
-        if HAS_SKYFIELD:
-            try:
-                self.ts = load.timescale()
-                self.eph = load('de421.bsp')
-                self.earth = self.eph['earth']
-                self.sun = self.eph['sun']
-                self.location = Topos(self.lat, self.lon)
-                self.skyfield_loaded = True
-            except Exception as e:
-                print(f"⚠️  Skyfield error: {e}")
-                self.skyfield_loaded = False
-        else:
-            self.skyfield_loaded = False
+        # The ephemeris is loaded on first use near Tehran noon; load errors
+        # are reported there and fall back to astronomical algorithms
+        self.skyfield_loaded = HAS_SKYFIELD
     
     def calculate_exact_equinox(self, shamsi_year):
-        """Calculate exact moment of vernal equinox for given Shamsi year"""
+        """Calculate exact moment of vernal equinox and the method used for it"""
         # The Gregorian year when this Shamsi year starts
         gregorian_year = shamsi_year + 621
         
-        print(f"\n⏳ Calculating لحظه تحویل سال for {shamsi_year}...")
+        # Only show progress when the answer is not already cached
+        first_time = gregorian_year not in _equinox_with_fallback.cache
+        use_skyfield = self._needs_skyfield(gregorian_year)
+        if use_skyfield:
+            first_time = gregorian_year not in _equinox_with_skyfield.cache
         
-        # Show progress bar
-        steps = 4
-        for i in range(steps + 1):
-            if i == 0:
-                progress_bar(i, steps, prefix='🌞 Calculating solar position', suffix='Starting...')
-            elif i == 1:
-                progress_bar(i, steps, prefix='🌞 Calculating solar position', suffix='Finding equinox...')
-            elif i == 2:
-                progress_bar(i, steps, prefix='🌞 Calculating solar position', suffix='Precise timing...')
-            elif i == 3:
-                progress_bar(i, steps, prefix='🌞 Calculating solar position', suffix='Converting...')
-            elif i == 4:
-                progress_bar(i, steps, prefix='🌞 Calculating solar position', suffix='Complete!')
-            
-            if i < steps:
-                time.sleep(0.4)
+        if first_time:
+            print(f"\n⏳ Calculating لحظه تحویل سال for {shamsi_year}...")
+            progress_bar(0, 1, prefix='🌞 Calculating solar position', suffix='Finding equinox...')
         
         # Calculate exact vernal equinox moment
-        if self.skyfield_loaded:
-            equinox_time = self._calculate_with_skyfield(gregorian_year)
-        else:
+        equinox_time, method = None, 'Astronomical Algorithm'
+        if use_skyfield:
+            try:
+                equinox_time = self._calculate_with_skyfield(gregorian_year)
+                method = 'Skyfield (High Accuracy)'
+            except Exception as e:
+                print(f"\n⚠️  Skyfield calculation failed: {e}")
+        if equinox_time is None:
             equinox_time = self._calculate_with_fallback(gregorian_year)
         
-        return equinox_time
+        if first_time:
+            progress_bar(1, 1, prefix='🌞 Calculating solar position', suffix='Complete!')
+        
+        return equinox_time, method
     
-    def _calculate_with_skyfield(self, gregorian_year):
-        """Calculate exact equinox using Skyfield"""
+    def prefetch_equinox(self, shamsi_year):
+        """Warm the equinox cache for a Shamsi year without printing progress"""
+        gregorian_year = shamsi_year + 621
+        
+        # Runs beside the prompt, so failures stay silent; a real prediction
+        # retries Skyfield and reports the error itself
         try:
-            # Search around March 19-22 for vernal equinox
-            t0 = self.ts.utc(gregorian_year, 3, 19)
-            t1 = self.ts.utc(gregorian_year, 3, 22)
-            t, y = almanac.find_discrete(t0, t1, almanac.seasons(self.eph))
-            
-            for time, season in zip(t, y):
-                if season == 0:  # Vernal equinox (0 = March equinox)
-                    return time.utc_datetime()
-        except Exception as e:
-            print(f"⚠️  Skyfield calculation failed: {e}")
+            if self._needs_skyfield(gregorian_year):
+                self._calculate_with_skyfield(gregorian_year)
+            else:
+                self._calculate_with_fallback(gregorian_year)
+        except Exception:
+            pass
+    
+    def _needs_skyfield(self, gregorian_year):
+        """Check if the Meeus estimate is too close to Tehran noon to trust"""
+        if not self.skyfield_loaded:
+            return False
         
-        return self._calculate_with_fallback(gregorian_year)
+        # The estimate is good to about a minute, which only matters for the
+        # before/after noon decision, so refine only near 12:00 Tehran time
+        tehran_time = self._calculate_with_fallback(gregorian_year) + _TEHRAN_OFFSET
+        seconds = tehran_time.hour * 3600 + tehran_time.minute * 60 + tehran_time.second
+        return abs(seconds - 12 * 3600) <= _SKYFIELD_BAND_SECONDS
+    
+    def _calculate_with_skyfield(self, gregorian_year):
+        """Calculate exact equinox using Skyfield"""
+        return _equinox_with_skyfield(gregorian_year)
     
     def _calculate_with_fallback(self, gregorian_year):
         """Calculate using astronomical formulas"""
-        # More precise astronomical calculation
-        y = gregorian_year - 2000
-        
-        # Astronomical formula for vernal equinox (Jean Meeus)
-        jde = 2451623.80984 + 365242.37404 * y/1000 + 0.05169 * (y/1000)**2 - 0.00411 * (y/1000)**3 - 0.00057 * (y/1000)**4
-        
-        # Convert Julian Ephemeris Day to datetime
-        jd = jde - 0.5
-        z = int(jd)
-        f = jd - z
-        
-        if z < 2299161:
-            a = z
-        else:
-            alpha = int((z - 1867216.25) / 36524.25)
-            a = z + 1 + alpha - int(alpha / 4)
-        
-        b = a + 1524
-        c = int((b - 122.1) / 365.25)
-        d = int(365.25 * c)
-        e = int((b - d) / 30.6001)
+        return _equinox_with_fallback(gregorian_year)
+    
+    @staticmethod
+    def calculate_equinox_table(shamsi_years):
+        """Calculate approximate equinox moments for several Shamsi years"""
+        gregorian_years = [shamsi_year + 621 for shamsi_year in shamsi_years]
         
-        day = b - d - int(30.6001 * e) + f
-        day_int = int(day)
-        month = e - 1 if e < 14 else e - 13
-        year_calc = c - 4716 if month > 2 else c - 4715
+        # NumPy is optional and only needed here, so import it on demand
+        try:
+            import numpy as np
+        except ImportError:
+            return [_equinox_with_fallback(year) for year in gregorian_years]
         
-        # Convert fractional day to time
-        fractional_day = day - day_int
-        total_seconds = int(fractional_day * 86400)
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
+        jde = _meeus_jde(np.asarray(gregorian_years, dtype=np.float64), cos=np.cos)
+        delta_t = np.array([_delta_t(year + 0.2) for year in gregorian_years])
         
-        return datetime(year_calc, month, day_int, hours, minutes, seconds)
+        # Julian Day 2440587.5 is the Unix epoch
+        seconds = np.floor((jde - 2440587.5) * 86400 - delta_t)
+        return seconds.astype('datetime64[s]').astype(datetime).tolist()
     
     def predict_nowruz(self, shamsi_year):
         """Predict لحظه تحویل سال for given Shamsi year"""
         # Calculate exact astronomical moment of vernal equinox
-        exact_equinox = self.calculate_exact_equinox(shamsi_year)
+        exact_equinox, method = self.calculate_exact_equinox(shamsi_year)
         
         # This exact moment IS the لحظه تحویل سال
         # Now determine if Nowruz is same day or next day based on solar noon rule
         
         # For Iran: if equinox is before 12:00 Tehran time, Nowruz is same day
         # If after 12:00 Tehran time, Nowruz is next day
-        tehran_time = exact_equinox + timedelta(hours=3, minutes=30)  # Convert UTC to Tehran time
+        tehran_time = exact_equinox + _TEHRAN_OFFSET  # Convert UTC to Tehran time
         
         if tehran_time.hour >= 12:
             nowruz_date = exact_equinox.date() + timedelta(days=1)
@@ -239,7 +407,7 @@ class NowruzPredictor:
             'exact_equinox_tehran': tehran_time,
             'nowruz_date': nowruz_date,
             'decision': decision,
-            'calculation_method': 'Skyfield (High Accuracy)' if self.skyfield_loaded else 'Astronomical Algorithm'
+            'calculation_method': method
         }
 
 def display_header():
@@ -258,16 +426,22 @@ def display_installation_info():
         print("    (Using astronomical algorithms)")
         print()
     else:
-        print("✅ Skyfield installed - Using high accuracy calculations")
+        print("✅ Skyfield installed - Used when the equinox is near Tehran noon")
+        print("    (Otherwise astronomical algorithms, accurate to about a minute)")
         print()
 
+# Year prompt written in one go by input()
+_PROMPT = (
+    "🔢 Enter the Persian (Shamsi) year you want to predict:\n"
+    "   Example: 1403, 1404, 1405, etc.\n"
+    "   📅 Year: "
+)
+
 def get_user_input():
     """Get Shamsi year from user"""
     while True:
         try:
-            print("🔢 Enter the Persian (Shamsi) year you want to predict:")
-            print("   Example: 1403, 1404, 1405, etc.")
-            shamsi_year = int(input("   📅 Year: "))
+            shamsi_year = int(input(_PROMPT))
             
             if 1300 <= shamsi_year <= 1500:
                 return shamsi_year
@@ -287,55 +461,65 @@ def display_results(result):
     equinox_tehran = result['exact_equinox_tehran']
     
     print(f"\n🌞 لحظه تحویل سال (Exact Vernal Equinox):")
-    print(f"   🕐 UTC Time:    {equinox_utc.strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"   🕐 Tehran Time: {equinox_tehran.strftime('%Y-%m-%d %H:%M:%S')} (UTC+3:30)")
-    print(f"   📅 Persian:     {PersianCalendar.format_persian_datetime(equinox_tehran)}")
+    print(f"   🕐 UTC Time:    {_ymd(equinox_utc)} {_hms(equinox_utc)}")
+    print(f"   🕐 Tehran Time: {_ymd(equinox_tehran)} {_hms(equinox_tehran)} (UTC+3:30)")
+    persian_tehran = PersianCalendar.gregorian_to_persian(equinox_tehran)
+    print(f"   📅 Persian:     {PersianCalendar.format_persian_date(*persian_tehran)} - {_hms(equinox_tehran)}")
     print(f"   📝 Decision:    {result['decision']}")
     
     # Nowruz date
     nowruz_date = result['nowruz_date']
-    nowruz_persian = PersianCalendar.format_persian_datetime(
-        datetime(nowruz_date.year, nowruz_date.month, nowruz_date.day, 0, 0, 0)
-    )
+    tehran_date = equinox_tehran.date()
+    
+    # Reuse the Tehran conversion when Nowruz falls on the same day
+    if nowruz_date == tehran_date:
+        nowruz_persian = persian_tehran
+    else:
+        nowruz_persian = PersianCalendar.gregorian_to_persian(nowruz_date)
     
     print(f"\n🎊 نوروز (Nowruz) - 1st Farvardin:")
-    print(f"   📅 Gregorian: {nowruz_date.strftime('%Y-%m-%d')}")
-    print(f"   📅 Persian:   {nowruz_persian.split(' - ')[0]}")
+    print(f"   📅 Gregorian: {_ymd(nowruz_date)}")
+    print(f"   📅 Persian:   {PersianCalendar.format_persian_date(*nowruz_persian)}")
     print(f"   🌍 For all of Iran (سراسر ایران)")
     
     print(f"\n📊 TECHNICAL DETAILS:")
     print(f"   🔢 Persian Year: {result['shamsi_year']}")
     print(f"   🔢 Gregorian Year: {result['shamsi_year'] + 621}")
-    print(f"   🕰️  Tehran Time: {equinox_tehran.strftime('%H:%M:%S')}")
+    print(f"   🕰️  Tehran Time: {_hms(equinox_tehran)}")
     print(f"   🎯 Calculation: {result['calculation_method']}")
     
     # International times
     print(f"\n🌐 INTERNATIONAL TIMES:")
-    ny_time = equinox_utc - timedelta(hours=4)  # EST
-    london_time = equinox_utc + timedelta(hours=1)  # BST
-    tokyo_time = equinox_utc + timedelta(hours=9)  # JST
+    ny_time = equinox_utc + _EST_OFFSET  # EST
+    london_time = equinox_utc + _BST_OFFSET  # BST
+    tokyo_time = equinox_utc + _JST_OFFSET  # JST
     
-    print(f"   🇺🇸 New York:  {ny_time.strftime('%Y-%m-%d %H:%M:%S')} (EST)")
-    print(f"   🇪🇺 London:    {london_time.strftime('%Y-%m-%d %H:%M:%S')} (BST)")
-    print(f"   🇯🇵 Tokyo:     {tokyo_time.strftime('%Y-%m-%d %H:%M:%S')} (JST)")
-    print(f"   🇮🇷 Tehran:    {equinox_tehran.strftime('%Y-%m-%d %H:%M:%S')} (IRST)")
+    print(f"   🇺🇸 New York:  {_ymd(ny_time)} {_hms(ny_time)} (EST)")
+    print(f"   🇪🇺 London:    {_ymd(london_time)} {_hms(london_time)} (BST)")
+    print(f"   🇯🇵 Tokyo:     {_ymd(tokyo_time)} {_hms(tokyo_time)} (JST)")
+    print(f"   🇮🇷 Tehran:    {_ymd(equinox_tehran)} {_hms(equinox_tehran)} (IRST)")
 
 def main():
     """Main function"""
     display_header()
     display_installation_info()
     
+    predictor = NowruzPredictor()
+    
     while True:
         # Get user input
         shamsi_year = get_user_input()
         
         # Calculate Nowruz
-        predictor = NowruzPredictor()
         result = predictor.predict_nowruz(shamsi_year)
         
         # Display results
         display_results(result)
         
+        # Next year is the usual follow-up, so compute it while waiting for input
+        if shamsi_year < 1500:
+            threading.Thread(target=predictor.prefetch_equinox, args=(shamsi_year + 1,), daemon=True).start()
+        
         # Ask if user wants to continue
         print("\n" + "=" * 70)
         continue_calc = input("\n🔍 Predict another year? (y/n): ").lower().strip()